@@ -1,11 +1,779 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import json
 import os
-from typing import Dict, List, Any
+import shutil
+import unicodedata
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional
 import csv
+import itertools
+import bisect
+import multiprocessing
+import queue
+from concurrent.futures import Future, ProcessPoolExecutor
+from array import array
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
+
+# Digits after the decimal point for currencies that don't use two
+CURRENCY_SCALES = {
+    "¥": 0, "JPY": 0, "₩": 0, "KRW": 0, "₫": 0, "VND": 0,
+    "BHD": 3, "KWD": 3, "OMR": 3, "JOD": 3, "TND": 3,
+}
+DEFAULT_CURRENCY_SCALE = 2
+
+# Record fields holding money, stored as integer minor units
+MONEY_FIELDS = {
+    "income": ("amount",),
+    "expenses": ("amount",),
+    "sales": ("unit_price", "total"),
+    "stock": ("unit_cost", "total_value"),
+}
+
+# Money field and grouping field tracked as cumulative daily series
+SERIES_FIELDS = {
+    "income": ("amount", "source"),
+    "expenses": ("amount", "category"),
+    "sales": ("total", "product"),
+}
+
+# Record field shown in each Treeview column, used for click-to-sort
+COLUMN_FIELDS = {
+    "income": {"Date": "date", "Source": "source", "Amount": "amount", "Description": "description"},
+    "expenses": {"Date": "date", "Category": "category", "Amount": "amount", "Description": "description"},
+    "sales": {"Date": "date", "Product": "product", "Quantity": "quantity", "Unit Price": "unit_price",
+              "Total": "total", "Customer": "customer"},
+    "stock": {"Product": "product", "Quantity": "quantity", "Unit Cost": "unit_cost",
+              "Total Value": "total_value", "Supplier": "supplier"},
+}
+
+# Report generator and the record tables included in each export
+EXPORT_REPORTS = {
+    "Monthly Report": ("monthly_report", ("income", "expenses", "sales")),
+    "Profit Analysis": ("profit_analysis", ("income", "expenses", "sales", "stock")),
+    "Stock Valuation": ("stock_report", ("stock",)),
+}
+EXPORT_FORMATS = {"Excel": ".xlsx", "PDF": ".pdf"}
+
+# Rows written between progress updates / cancellation checks in export workers
+EXPORT_PROGRESS_INTERVAL = 500
+
+# Number of periods shown in the profit trend chart
+TREND_PERIOD_COUNTS = {"Daily": 30, "Weekly": 26, "Monthly": 12}
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+class Currency:
+    """Fixed-point money arithmetic on 64-bit integer minor units (e.g. cents)"""
+    
+    def __init__(self, symbol: str, scale: Optional[int] = None):
+        self.symbol = symbol
+        self.scale = currency_scale(symbol) if scale is None else scale
+        self.factor = 10 ** self.scale
+    
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "Currency":
+        """Currency for displaying and converting the stored ledger"""
+        return cls(settings["currency"], settings.get("money_scale"))
+    
+    def to_minor(self, value: Decimal) -> int:
+        """Round a decimal amount to minor units, half to even"""
+        if not value.is_finite():
+            raise ValueError(f"Invalid amount: {value}")
+        try:
+            minor = int(value.scaleb(self.scale).quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+        except InvalidOperation:
+            raise ValueError(f"Amount out of range: {value}")
+        if not INT64_MIN <= minor <= INT64_MAX:
+            raise ValueError(f"Amount out of range: {value}")
+        return minor
+    
+    def parse(self, text: str) -> int:
+        """Convert user-entered text to minor units without going through float"""
+        try:
+            value = Decimal(text.strip())
+        except InvalidOperation:
+            raise ValueError(f"Invalid amount: {text!r}")
+        if value.is_finite() and not self.fits(value):
+            raise ValueError(f"Too many decimals for this currency: {text!r}")
+        return self.to_minor(value)
+    
+    def to_decimal(self, minor: int) -> Decimal:
+        """Exact decimal value of an amount in minor units"""
+        return Decimal(minor).scaleb(-self.scale)
+    
+    def fits(self, value: Decimal) -> bool:
+        """Whether a finite amount has no more decimals than this scale holds"""
+        _, digits, exponent = value.as_tuple()
+        # Trailing zeros (as in '1.500') don't count as extra decimals
+        trailing_zeros = len(digits) - len(bytes(digits).rstrip(b"\0"))
+        return not any(digits) or exponent + trailing_zeros >= -self.scale
+    
+    def from_float(self, value: float) -> int:
+        """Convert a legacy float amount using its shortest decimal repr"""
+        return self.to_minor(Decimal(repr(float(value))))
+    
+    def multiply(self, minor: int, quantity: float) -> int:
+        """Exact product of an amount and a (possibly fractional) quantity"""
+        try:
+            return self.to_minor(self.to_decimal(minor) * Decimal(repr(quantity)))
+        except InvalidOperation:
+            raise ValueError(f"Invalid quantity: {quantity!r}")
+    
+    def divide(self, minor: int, count: int) -> int:
+        """Amount split evenly across count items, rounded half to even"""
+        if count == 0:
+            return 0
+        return self.to_minor(self.to_decimal(minor) / count)
+    
+    def rescale(self, minor: int, scale: int) -> int:
+        """Convert minor units stored at another scale to this one"""
+        return self.to_minor(Decimal(minor).scaleb(-scale))
+    
+    def to_text(self, minor: int) -> str:
+        """Plain decimal text, e.g. 123456 -> '1234.56'"""
+        sign = "-" if minor < 0 else ""
+        whole, fraction = divmod(abs(minor), self.factor)
+        if self.scale == 0:
+            return f"{sign}{whole}"
+        return f"{sign}{whole}.{fraction:0{self.scale}d}"
+    
+    def format(self, minor: int) -> str:
+        """Text with the currency symbol, as shown in the UI"""
+        return f"{self.symbol}{self.to_text(minor)}"
+
+
+def currency_scale(symbol: str) -> int:
+    """Number of minor-unit digits used by a currency symbol or code"""
+    return CURRENCY_SCALES.get(symbol.strip().upper(), DEFAULT_CURRENCY_SCALE)
+
+
+def migrate_money(data: Dict[str, Any], currency: Currency) -> List[str]:
+    """Convert legacy float money fields to integer minor units in place
+    
+    Values that can't be converted (missing, NaN, infinite or out of range)
+    are set to zero, and values with more decimals than the scale are
+    rounded; each is described in the returned list.
+    """
+    problems = []
+    for record_type, fields in MONEY_FIELDS.items():
+        for number, record in enumerate(data[record_type], 1):
+            for field in fields:
+                value = record.get(field)
+                try:
+                    record[field] = currency.from_float(value)
+                except (TypeError, ValueError):
+                    problems.append(f"{record_type} #{number} {field}: {value!r} set to 0")
+                    record[field] = 0
+                    continue
+                if not currency.fits(Decimal(repr(float(value)))):
+                    problems.append(f"{record_type} #{number} {field}: {value!r} rounded to "
+                                    f"{currency.to_text(record[field])}")
+    data["settings"]["money_scale"] = currency.scale
+    return problems
+
+
+def rescale_money(data: Dict[str, Any], scale: int) -> bool:
+    """Raise the scale of stored minor units, converting every amount or none
+    
+    The stored scale never goes down, so switching to a currency with fewer
+    decimals keeps existing amounts exact. Returns whether anything changed.
+    """
+    old_scale = data["settings"]["money_scale"]
+    if scale <= old_scale:
+        return False
+    
+    currency = Currency("", scale)
+    converted = [(record, field, currency.rescale(record[field], old_scale))
+                 for record_type, fields in MONEY_FIELDS.items()
+                 for record in data[record_type]
+                 for field in fields]
+    for record, field, minor in converted:
+        record[field] = minor
+    data["settings"]["money_scale"] = scale
+    return True
+
+
+class MoneyColumns:
+    """Money fields packed into int64 arrays so totals are fast, exact sums"""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.columns: Dict[tuple, array] = {}
+    
+    def get(self, record_type: str, field: str) -> array:
+        """Packed column for a field, built on first use"""
+        key = (record_type, field)
+        column = self.columns.get(key)
+        if column is None:
+            column = array('q', (record[field] for record in self.data[record_type]))
+            self.columns[key] = column
+        return column
+    
+    def total(self, record_type: str, field: str) -> int:
+        """Exact sum of a money field across all records"""
+        return sum(self.get(record_type, field))
+    
+    def append(self, record_type: str, record: Dict[str, Any]):
+        """Extend already-built columns with a newly added record"""
+        for (column_type, field), column in self.columns.items():
+            if column_type == record_type:
+                column.append(record[field])
+    
+    def remove(self, record_type: str, index: int):
+        """Drop a deleted record from already-built columns"""
+        for (column_type, field), column in self.columns.items():
+            if column_type == record_type:
+                del column[index]
+    
+    def invalidate(self, record_type: Optional[str] = None):
+        """Drop columns for a record type (or all) after records are edited"""
+        if record_type is None:
+            self.columns.clear()
+        else:
+            for key in [key for key in self.columns if key[0] == record_type]:
+                del self.columns[key]
+
+
+def parse_day(text: str) -> Optional[int]:
+    """Ordinal of a YYYY-MM-DD record date, or None if it can't be parsed"""
+    try:
+        # strptime also accepts dates without zero padding, e.g. 2026-10-5
+        return datetime.strptime(text.strip(), "%Y-%m-%d").toordinal()
+    except (ValueError, AttributeError):
+        return None
+
+
+class DailySeries:
+    """Running totals over the days that have entries, so a date-range total is two lookups"""
+    
+    def __init__(self):
+        self.days = array('q')  # ordinals of days with entries, ascending
+        self.cumulative = array('q')  # total of all entries up to and including days[i]
+    
+    @classmethod
+    def build(cls, entries: Iterable[tuple]) -> "DailySeries":
+        """Series from (day ordinal, amount) pairs"""
+        per_day: Dict[int, int] = {}
+        for day, amount in entries:
+            per_day[day] = per_day.get(day, 0) + amount
+        
+        series = cls()
+        running = 0
+        for day in sorted(per_day):
+            running += per_day[day]
+            series.days.append(day)
+            series.cumulative.append(running)
+        return series
+    
+    def add(self, day: int, amount: int):
+        """Record an amount on a day (negative to remove one)"""
+        i = bisect.bisect_left(self.days, day)
+        if i == len(self.days) or self.days[i] != day:
+            self.days.insert(i, day)
+            self.cumulative.insert(i, self.cumulative[i - 1] if i else 0)
+        
+        # Most entries are for the latest day, so this touches few elements
+        cumulative = self.cumulative
+        for j in range(i, len(cumulative)):
+            cumulative[j] += amount
+    
+    def through(self, day: int) -> int:
+        """Total of all days up to and including day"""
+        i = bisect.bisect_right(self.days, day)
+        return self.cumulative[i - 1] if i else 0
+    
+    def total(self, first: int, last: int) -> int:
+        """Total of the days from first to last inclusive"""
+        return self.through(last) - self.through(first - 1)
+
+
+class LedgerSeries:
+    """Daily cumulative series for income, expenses and sales, overall and per key"""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.totals: Dict[str, DailySeries] = {}
+        self.by_key: Dict[str, Dict[str, DailySeries]] = {}
+        self.undated: Dict[str, int] = {}  # records left out for lacking a YYYY-MM-DD date
+        self.rebuild()
+    
+    def rebuild(self, record_type: Optional[str] = None):
+        """Recompute series from the records of a type (or all tracked types)"""
+        record_types = SERIES_FIELDS if record_type is None else [record_type]
+        for rtype in record_types:
+            if rtype not in SERIES_FIELDS:
+                continue
+            field, key_field = SERIES_FIELDS[rtype]
+            entries: List[tuple] = []
+            keyed: Dict[str, List[tuple]] = {}
+            undated = 0
+            for record in self.data[rtype]:
+                day = parse_day(record["date"])
+                if day is None:
+                    undated += 1
+                else:
+                    entry = (day, record[field])
+                    entries.append(entry)
+                    keyed.setdefault(record[key_field], []).append(entry)
+            self.undated[rtype] = undated
+            self.totals[rtype] = DailySeries.build(entries)
+            self.by_key[rtype] = {key: DailySeries.build(items) for key, items in keyed.items()}
+    
+    def add(self, record_type: str, record: Dict[str, Any], sign: int = 1):
+        """Fold a new record into the series (sign=-1 takes it back out)"""
+        if record_type not in SERIES_FIELDS:
+            return
+        day = parse_day(record["date"])
+        if day is None:
+            self.undated[record_type] += sign
+            return
+        field, key_field = SERIES_FIELDS[record_type]
+        amount = sign * record[field]
+        self.totals[record_type].add(day, amount)
+        self.by_key[record_type].setdefault(record[key_field], DailySeries()).add(day, amount)
+    
+    def total(self, record_type: str, first: date, last: date, key: Optional[str] = None) -> int:
+        """Total of a record type between two dates inclusive, optionally for one key"""
+        if key is None:
+            series = self.totals[record_type]
+        else:
+            series = self.by_key[record_type].get(key)
+            if series is None:
+                return 0
+        return series.total(first.toordinal(), last.toordinal())
+    
+    def key_totals(self, record_type: str, first: date, last: date) -> Dict[str, int]:
+        """Non-zero totals per key (category, product, ...) between two dates"""
+        totals = {}
+        for key, series in self.by_key[record_type].items():
+            amount = series.total(first.toordinal(), last.toordinal())
+            if amount:
+                totals[key] = amount
+        return totals
+    
+    def profit(self, first: date, last: date) -> int:
+        """Income minus expenses between two dates inclusive"""
+        return self.total("income", first, last) - self.total("expenses", first, last)
+
+
+def trend_periods(granularity: str, end: date, count: int) -> List[tuple]:
+    """(label, first day, last day) for the count periods ending with end's period"""
+    periods = []
+    if granularity == "Daily":
+        for offset in range(count - 1, -1, -1):
+            day = end - timedelta(days=offset)
+            periods.append((day.strftime("%m-%d"), day, day))
+    elif granularity == "Weekly":
+        week_start = end - timedelta(days=end.weekday())
+        for offset in range(count - 1, -1, -1):
+            first = week_start - timedelta(weeks=offset)
+            periods.append((first.strftime("%m-%d"), first, first + timedelta(days=6)))
+    else:
+        year, month = end.year, end.month
+        for _ in range(count):
+            first = date(year, month, 1)
+            following = date(year + month // 12, month % 12 + 1, 1)
+            periods.append((first.strftime("%Y-%m"), first, following - timedelta(days=1)))
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        periods.reverse()
+    return periods
+
+
+def sort_key(value: Any) -> Any:
+    """Key for ordering a column value; text sorts case-insensitively"""
+    return value.casefold() if isinstance(value, str) else value
+
+
+class SortCache:
+    """Cached sort keys and permutations (record indices in order) per list and field"""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.keys: Dict[tuple, list] = {}
+        self.orders: Dict[tuple, List[int]] = {}
+    
+    def order(self, record_type: str, field: str) -> List[int]:
+        """Record indices sorted ascending by field, computed on first use"""
+        cache_key = (record_type, field)
+        order = self.orders.get(cache_key)
+        if order is None:
+            keys = [sort_key(record[field]) for record in self.data[record_type]]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self.keys[cache_key] = keys
+            self.orders[cache_key] = order
+        return order
+    
+    def append(self, record_type: str, record: Dict[str, Any]):
+        """Place a record just appended to its list into the cached orders"""
+        index = len(self.data[record_type]) - 1
+        for (cached_type, field), order in self.orders.items():
+            if cached_type == record_type:
+                keys = self.keys[(cached_type, field)]
+                keys.append(sort_key(record[field]))
+                bisect.insort(order, index, key=keys.__getitem__)
+    
+    def position(self, record_type: str, field: str, index: int) -> int:
+        """Place of a record in the ascending order, found by binary search
+        
+        Only valid for the most recently appended record, which insort puts
+        after any records with an equal key.
+        """
+        order = self.order(record_type, field)
+        keys = self.keys[(record_type, field)]
+        return bisect.bisect_right(order, keys[index], key=keys.__getitem__) - 1
+    
+    def invalidate(self, record_type: Optional[str] = None):
+        """Drop cached orders for a record type (or all) after edits or deletes"""
+        for cache_key in [key for key in self.orders if record_type is None or key[0] == record_type]:
+            del self.orders[cache_key]
+            del self.keys[cache_key]
+
+
+class ReportBuilder:
+    """Produce report sections as a stream of text lines"""
+    
+    def __init__(self, data: Dict[str, Any], columns: Optional[MoneyColumns] = None,
+                 series: Optional[LedgerSeries] = None):
+        self.data = data
+        self.columns = columns if columns is not None else MoneyColumns(data)
+        self.series = series if series is not None else LedgerSeries(data)
+        self.money = Currency.from_settings(data["settings"])
+    
+    def monthly_report(self) -> Iterator[str]:
+        """Yield the lines of the monthly financial report"""
+        _, first, last = trend_periods("Monthly", date.today(), 1)[0]
+        current_month = first.strftime("%Y-%m")
+        money = self.money
+        
+        # Calculate monthly totals
+        monthly_income = self.series.total("income", first, last)
+        monthly_expenses = self.series.total("expenses", first, last)
+        monthly_sales = self.series.total("sales", first, last)
+        monthly_profit = monthly_income - monthly_expenses
+        
+        yield ""
+        yield f"MONTHLY FINANCIAL REPORT - {current_month}"
+        yield "=" * 50
+        yield ""
+        yield "INCOME:"
+        yield f"Total Monthly Income: {money.format(monthly_income)}"
+        yield ""
+        yield "EXPENSES:"
+        yield f"Total Monthly Expenses: {money.format(monthly_expenses)}"
+        yield ""
+        yield "SALES:"
+        yield f"Total Monthly Sales: {money.format(monthly_sales)}"
+        yield ""
+        yield "PROFIT/LOSS:"
+        yield f"Net Profit: {money.format(monthly_profit)}"
+        yield ""
+        yield "EXPENSE BREAKDOWN:"
+        
+        # Expense breakdown by category
+        expense_categories = self.series.key_totals("expenses", first, last)
+        for category, amount in expense_categories.items():
+            yield f"  {category}: {money.format(amount)}"
+        
+        yield from self.undated_note()
+    
+    def undated_note(self) -> Iterator[str]:
+        """Yield a note on records the date-based totals had to leave out"""
+        undated = sum(self.series.undated.values())
+        if undated:
+            yield ""
+            yield f"Note: {undated} record(s) without a YYYY-MM-DD date are not included above"
+    
+    def range_report(self, first: date, last: date) -> Iterator[str]:
+        """Yield the lines of a summary for an arbitrary date range"""
+        money = self.money
+        
+        range_income = self.series.total("income", first, last)
+        range_expenses = self.series.total("expenses", first, last)
+        range_sales = self.series.total("sales", first, last)
+        
+        yield ""
+        yield f"DATE RANGE REPORT - {first.isoformat()} to {last.isoformat()}"
+        yield "=" * 50
+        yield ""
+        yield f"Total Income: {money.format(range_income)}"
+        yield f"Total Expenses: {money.format(range_expenses)}"
+        yield f"Total Sales: {money.format(range_sales)}"
+        yield f"Net Profit: {money.format(range_income - range_expenses)}"
+        yield ""
+        yield "EXPENSE BREAKDOWN:"
+        for category, amount in self.series.key_totals("expenses", first, last).items():
+            yield f"  {category}: {money.format(amount)}"
+        yield ""
+        yield "SALES BY PRODUCT:"
+        for product, amount in self.series.key_totals("sales", first, last).items():
+            yield f"  {product}: {money.format(amount)}"
+        
+        yield from self.undated_note()
+    
+    def profit_analysis(self) -> Iterator[str]:
+        """Yield the lines of the profit analysis report"""
+        money = self.money
+        
+        total_income = self.columns.total("income", "amount")
+        total_expenses = self.columns.total("expenses", "amount")
+        total_sales = self.columns.total("sales", "total")
+        net_profit = total_income - total_expenses
+        
+        # Calculate stock value
+        stock_value = self.columns.total("stock", "total_value")
+        
+        yield ""
+        yield "PROFIT ANALYSIS REPORT"
+        yield "=" * 50
+        yield ""
+        yield "OVERALL FINANCIAL POSITION:"
+        yield f"Total Income: {money.format(total_income)}"
+        yield f"Total Expenses: {money.format(total_expenses)}"
+        yield f"Total Sales Revenue: {money.format(total_sales)}"
+        yield f"Net Profit: {money.format(net_profit)}"
+        yield ""
+        yield "ASSET VALUATION:"
+        yield f"Current Stock Value: {money.format(stock_value)}"
+        yield ""
+        yield "PERFORMANCE METRICS:"
+        yield f"Profit Margin: {((net_profit / total_income) * 100) if total_income > 0 else 0:.1f}%"
+        yield f"Expense Ratio: {((total_expenses / total_income) * 100) if total_income > 0 else 0:.1f}%"
+        yield ""
+        yield "TOP PERFORMING PRODUCTS:"
+        
+        # Product performance analysis
+        product_sales = {}
+        for record in self.data["sales"]:
+            product = record["product"]
+            product_sales[product] = product_sales.get(product, 0) + record["total"]
+        
+        # Sort by revenue
+        sorted_products = sorted(product_sales.items(), key=lambda x: x[1], reverse=True)
+        for product, revenue in sorted_products[:5]:  # Top 5 products
+            yield f"  {product}: {money.format(revenue)}"
+        
+        if not sorted_products:
+            yield "  No sales data available"
+    
+    def stock_report(self) -> Iterator[str]:
+        """Yield the lines of the stock valuation report"""
+        money = self.money
+        
+        total_stock_value = self.columns.total("stock", "total_value")
+        total_items = len(self.data["stock"])
+        
+        # Sort stock by value
+        sorted_stock = sorted(self.data["stock"], key=lambda x: x["total_value"], reverse=True)
+        
+        # Low stock alerts (items with quantity < 10)
+        low_stock = [item for item in self.data["stock"] if item["quantity"] < 10]
+        
+        yield ""
+        yield "STOCK VALUATION REPORT"
+        yield "=" * 50
+        yield ""
+        yield "STOCK SUMMARY:"
+        yield f"Total Stock Items: {total_items}"
+        yield f"Total Stock Value: {money.format(total_stock_value)}"
+        yield f"Average Item Value: {money.format(money.divide(total_stock_value, total_items))}"
+        yield ""
+        yield "DETAILED STOCK BREAKDOWN:"
+        
+        for record in sorted_stock:
+            yield ""
+            yield f"Product: {record['product']}"
+            yield f"  Quantity: {record['quantity']}"
+            yield f"  Unit Cost: {money.format(record['unit_cost'])}"
+            yield f"  Total Value: {money.format(record['total_value'])}"
+            yield f"  Supplier: {record['supplier']}"
+        
+        if not sorted_stock:
+            yield "No stock records available"
+        
+        if low_stock:
+            yield ""
+            yield "LOW STOCK ALERTS:"
+            for item in low_stock:
+                yield f"  {item['product']}: {item['quantity']} units remaining"
+
+
+class ReportPager:
+    """Render a stream of report lines into a Text widget one page at a time"""
+    
+    def __init__(self, text: tk.Text, scrollbar: ttk.Scrollbar, page_size: int = 200):
+        self.text = text
+        self.scrollbar = scrollbar
+        self.page_size = page_size
+        self.lines: Optional[Iterator[str]] = None
+        self.pending = False
+        self.text.configure(yscrollcommand=self.on_scroll)
+    
+    def show(self, lines: Iterable[str]):
+        """Replace the widget contents with the first page of a new report"""
+        self.lines = iter(lines)
+        self.text.delete(1.0, tk.END)
+        self.load_page()
+    
+    def load_page(self):
+        """Append the next page of lines, if any remain"""
+        self.pending = False
+        if self.lines is None:
+            return
+        
+        page = list(itertools.islice(self.lines, self.page_size))
+        if len(page) < self.page_size:
+            self.lines = None
+        if page:
+            self.text.insert(tk.END, "\n".join(page) + "\n")
+    
+    def on_scroll(self, first, last):
+        """Keep the scrollbar in sync and fetch more lines near the bottom"""
+        self.scrollbar.set(first, last)
+        if self.lines is not None and not self.pending and float(last) >= 0.9:
+            self.pending = True
+            self.text.after_idle(self.load_page)
+
+
+class ExportCancelled(Exception):
+    """Raised inside an export worker when its job has been cancelled"""
+
+
+class ExportProgress:
+    """Progress reporting and cancellation checks for one export job"""
+    
+    def __init__(self, job_id: int, total: int, progress_queue, cancel):
+        self.job_id = job_id
+        self.total = total
+        self.done = 0
+        self.progress_queue = progress_queue
+        self.cancel = cancel
+    
+    def step(self):
+        """Count one unit of work, reporting and checking for cancellation periodically"""
+        self.done += 1
+        if self.done % EXPORT_PROGRESS_INTERVAL == 0 or self.done == self.total:
+            if self.cancel.is_set():
+                raise ExportCancelled()
+            self.progress_queue.put((self.job_id, self.done, self.total))
+
+
+def export_rows(builder: ReportBuilder, record_type: str, cell: Callable[[int], Any]) -> Iterator[list]:
+    """Table rows for a record type, with money fields passed through cell"""
+    money_fields = MONEY_FIELDS[record_type]
+    fields = list(COLUMN_FIELDS[record_type].values())
+    for record in builder.data[record_type]:
+        yield [cell(record[field]) if field in money_fields else record[field] for field in fields]
+
+
+def write_excel_export(builder: ReportBuilder, report: str, path: str, progress: ExportProgress):
+    """Write a report and its record tables to an Excel workbook"""
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+    except ImportError:
+        raise RuntimeError("Excel export requires openpyxl (pip install openpyxl)")
+    
+    method, record_types = EXPORT_REPORTS[report]
+    money = builder.money
+    number_format = "0" if money.scale == 0 else "0." + "0" * money.scale
+    workbook = Workbook(write_only=True)
+    
+    sheet = workbook.create_sheet("Report")
+    for line in getattr(builder, method)():
+        sheet.append([line])
+    progress.step()
+    
+    for record_type in record_types:
+        sheet = workbook.create_sheet(record_type.title())
+        
+        def money_cell(minor):
+            cell = WriteOnlyCell(sheet, value=money.to_decimal(minor))
+            cell.number_format = number_format
+            return cell
+        
+        sheet.append(list(COLUMN_FIELDS[record_type]))
+        for row in export_rows(builder, record_type, money_cell):
+            sheet.append(row)
+            progress.step()
+    
+    workbook.save(path)
+
+
+def latin1_symbol(symbol: str) -> str:
+    """Currency symbol as Latin-1 text, spelled out by Unicode name if needed"""
+    try:
+        symbol.encode("latin-1")
+        return symbol
+    except UnicodeEncodeError:
+        return " ".join(unicodedata.name(char, "?") for char in symbol)
+
+
+def write_pdf_export(builder: ReportBuilder, report: str, path: str, progress: ExportProgress):
+    """Write a report and its record tables to a PDF document"""
+    try:
+        from fpdf import FPDF
+        from fpdf.enums import XPos, YPos
+    except ImportError:
+        raise RuntimeError("PDF export requires fpdf2 (pip install fpdf2)")
+    
+    def write_line(text):
+        # The built-in PDF fonts only cover Latin-1
+        pdf.cell(0, 5, text=text.encode("latin-1", "replace").decode("latin-1"),
+                 new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    
+    method, record_types = EXPORT_REPORTS[report]
+    symbol = builder.money.symbol
+    # Write plain amounts and name the currency once, since symbols like
+    # the euro or won sign are missing from the built-in fonts
+    builder.money = money = Currency("", builder.money.scale)
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Courier", size=9)
+    
+    write_line(f"Currency: {latin1_symbol(symbol)}")
+    for line in getattr(builder, method)():
+        write_line(line)
+    progress.step()
+    
+    for record_type in record_types:
+        columns = list(COLUMN_FIELDS[record_type])
+        width = 90 // len(columns)
+        pdf.add_page()
+        write_line(record_type.upper())
+        write_line("  ".join(column[:width].ljust(width) for column in columns))
+        for row in export_rows(builder, record_type, money.format):
+            write_line("  ".join(str(value)[:width].ljust(width) for value in row))
+            progress.step()
+    
+    pdf.output(path)
+
+
+def run_export_job(job_id: int, report: str, export_format: str, snapshot: str,
+                   path: str, progress_queue, cancel) -> str:
+    """Build an Excel or PDF export from a JSON snapshot in a worker process"""
+    # The pool may have prefetched this job before it was cancelled
+    if cancel.is_set():
+        raise ExportCancelled()
+    
+    data = json.loads(snapshot)
+    builder = ReportBuilder(data)
+    record_types = EXPORT_REPORTS[report][1]
+    progress = ExportProgress(job_id, 1 + sum(len(data[t]) for t in record_types),
+                              progress_queue, cancel)
+    writer = write_excel_export if export_format == "Excel" else write_pdf_export
+    
+    try:
+        writer(builder, report, path, progress)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return path
+
 
 class BusinessTracker:
     def __init__(self, root):
@@ -16,10 +784,24 @@ class BusinessTracker:
         # Data storage
         self.data_file = "business_data.json"
         self.data = self.load_data()
+        self.columns = MoneyColumns(self.data)
+        self.series = LedgerSeries(self.data)
+        self.sorts = SortCache(self.data)
+        self.sort_state: Dict[str, tuple] = {}  # record type -> (column, descending)
+        self.trend_redraw_pending = False
+        self.report_refresh_pending = False
+        
+        # Excel/PDF export workers, started on first use
+        self.export_pool: Optional[ProcessPoolExecutor] = None
+        self.export_manager = None
+        self.export_queue = None
+        self.export_jobs: Dict[int, Dict[str, Any]] = {}
+        self.next_export_id = 1
         
         # Create main interface
         self.create_widgets()
         self.refresh_displays()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def load_data(self) -> Dict[str, Any]:
         """Load data from JSON file or create default structure"""
@@ -30,7 +812,8 @@ class BusinessTracker:
             "stock": [],
             "settings": {
                 "currency": "$",
-                "business_name": "My Business"
+                "business_name": "My Business",
+                "money_scale": DEFAULT_CURRENCY_SCALE
             }
         }
         
@@ -38,15 +821,35 @@ class BusinessTracker:
             try:
                 with open(self.data_file, 'r') as f:
                     data = json.load(f)
+                    # Files written before fixed-point money hold float amounts
+                    legacy_money = "money_scale" not in data.get("settings", {})
                     # Ensure all required keys exist
                     for key in default_data:
                         if key not in data:
                             data[key] = default_data[key]
-                    return data
             except:
                 return default_data
+            
+            if legacy_money:
+                self.migrate_legacy_data(data)
+            return data
         return default_data
     
+    def migrate_legacy_data(self, data: Dict[str, Any]):
+        """Convert a pre-fixed-point data file, warning about unconvertible amounts"""
+        # Legacy files always showed two decimals, so never migrate below that
+        symbol = data["settings"]["currency"]
+        problems = migrate_money(data, Currency(symbol, max(currency_scale(symbol), DEFAULT_CURRENCY_SCALE)))
+        if not problems:
+            return
+        
+        backup_file = self.data_file + ".bak"
+        shutil.copyfile(self.data_file, backup_file)
+        shown = "\n".join(problems[:10])
+        more = f"\n...and {len(problems) - 10} more" if len(problems) > 10 else ""
+        messagebox.showwarning("Warning", f"Some amounts could not be converted exactly:\n"
+                                          f"{shown}{more}\n\nThe original file was copied to {backup_file}")
+    
     def save_data(self):
         """Save data to JSON file"""
         try:
@@ -119,7 +922,7 @@ class BusinessTracker:
         self.income_tree = ttk.Treeview(display_frame, columns=columns, show="headings", height=10)
         
         for col in columns:
-            self.income_tree.heading(col, text=col)
+            self.income_tree.heading(col, text=col, command=lambda c=col: self.sort_by("income", c))
             self.income_tree.column(col, width=150)
         
         scrollbar_income = ttk.Scrollbar(display_frame, orient=tk.VERTICAL, command=self.income_tree.yview)
@@ -172,7 +975,7 @@ class BusinessTracker:
         self.expense_tree = ttk.Treeview(display_frame, columns=columns, show="headings", height=10)
         
         for col in columns:
-            self.expense_tree.heading(col, text=col)
+            self.expense_tree.heading(col, text=col, command=lambda c=col: self.sort_by("expenses", c))
             self.expense_tree.column(col, width=150)
         
         scrollbar_expense = ttk.Scrollbar(display_frame, orient=tk.VERTICAL, command=self.expense_tree.yview)
@@ -225,7 +1028,7 @@ class BusinessTracker:
         self.sales_tree = ttk.Treeview(display_frame, columns=columns, show="headings", height=10)
         
         for col in columns:
-            self.sales_tree.heading(col, text=col)
+            self.sales_tree.heading(col, text=col, command=lambda c=col: self.sort_by("sales", c))
             self.sales_tree.column(col, width=120)
         
         scrollbar_sales = ttk.Scrollbar(display_frame, orient=tk.VERTICAL, command=self.sales_tree.yview)
@@ -273,7 +1076,7 @@ class BusinessTracker:
         self.stock_tree = ttk.Treeview(display_frame, columns=columns, show="headings", height=10)
         
         for col in columns:
-            self.stock_tree.heading(col, text=col)
+            self.stock_tree.heading(col, text=col, command=lambda c=col: self.sort_by("stock", c))
             self.stock_tree.column(col, width=140)
         
         scrollbar_stock = ttk.Scrollbar(display_frame, orient=tk.VERTICAL, command=self.stock_tree.yview)
@@ -296,7 +1099,8 @@ class BusinessTracker:
         
         self.summary_text = tk.Text(summary_frame, height=15, width=70)
         summary_scrollbar = ttk.Scrollbar(summary_frame, orient=tk.VERTICAL, command=self.summary_text.yview)
-        self.summary_text.configure(yscrollcommand=summary_scrollbar.set)
+        self.report_pager = ReportPager(self.summary_text, summary_scrollbar)
+        self.current_report: Optional[Callable[[], Iterator[str]]] = None
         
         self.summary_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         summary_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -311,6 +1115,75 @@ class BusinessTracker:
                  bg="#2196F3", fg="white").pack(side=tk.LEFT, padx=5)
         tk.Button(buttons_frame, text="Stock Valuation Report", command=self.generate_stock_report,
                  bg="#FF9800", fg="white").pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons_frame, text="Save Report", command=self.save_report,
+                 bg="#607D8B", fg="white").pack(side=tk.LEFT, padx=5)
+        
+        # Date range section
+        range_frame = tk.Frame(reports_frame)
+        range_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(range_frame, text="From:").pack(side=tk.LEFT)
+        self.range_from = tk.Entry(range_frame, width=12)
+        self.range_from.insert(0, date.today().replace(day=1).strftime("%Y-%m-%d"))
+        self.range_from.pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(range_frame, text="To:").pack(side=tk.LEFT)
+        self.range_to = tk.Entry(range_frame, width=12)
+        self.range_to.insert(0, date.today().strftime("%Y-%m-%d"))
+        self.range_to.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(range_frame, text="Date Range Report", command=self.generate_range_report,
+                 bg="#009688", fg="white").pack(side=tk.LEFT, padx=5)
+        
+        lower_frame = tk.Frame(reports_frame)
+        lower_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # Profit trend section
+        trend_frame = tk.LabelFrame(lower_frame, text="Profit Trend", padx=10, pady=10)
+        trend_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        trend_controls = tk.Frame(trend_frame)
+        trend_controls.pack(fill=tk.X)
+        
+        self.trend_granularity = ttk.Combobox(trend_controls, width=10, state="readonly",
+                                              values=list(TREND_PERIOD_COUNTS))
+        self.trend_granularity.set("Daily")
+        self.trend_granularity.pack(side=tk.LEFT, padx=5)
+        self.trend_granularity.bind("<<ComboboxSelected>>", lambda event: self.draw_profit_trend())
+        
+        tk.Button(trend_controls, text="Show Trend", command=self.draw_profit_trend,
+                 bg="#3F51B5", fg="white").pack(side=tk.LEFT, padx=5)
+        
+        self.trend_canvas = tk.Canvas(trend_frame, height=180, bg="white")
+        self.trend_canvas.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.trend_canvas.bind("<Configure>", lambda event: self.draw_profit_trend())
+        
+        # Excel/PDF export section
+        export_frame = tk.LabelFrame(lower_frame, text="Excel / PDF Export", padx=10, pady=10)
+        export_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0))
+        
+        export_controls = tk.Frame(export_frame)
+        export_controls.pack(fill=tk.X)
+        
+        self.export_report = ttk.Combobox(export_controls, width=16, state="readonly",
+                                          values=list(EXPORT_REPORTS))
+        self.export_report.set("Monthly Report")
+        self.export_report.pack(side=tk.LEFT, padx=5)
+        
+        for export_format in EXPORT_FORMATS:
+            tk.Button(export_controls, text=f"Export {export_format}",
+                     command=lambda f=export_format: self.start_export(f),
+                     bg="#795548", fg="white").pack(side=tk.LEFT, padx=5)
+        
+        columns = ("Job", "Report", "Format", "Status")
+        self.export_tree = ttk.Treeview(export_frame, columns=columns, show="headings", height=5)
+        for col, width in zip(columns, (40, 110, 60, 160)):
+            self.export_tree.heading(col, text=col)
+            self.export_tree.column(col, width=width)
+        self.export_tree.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        tk.Button(export_frame, text="Cancel Selected", command=self.cancel_exports,
+                 bg="#f44336", fg="white").pack(pady=5)
     
     def create_settings_tab(self):
         """Create settings tab"""
@@ -334,17 +1207,30 @@ class BusinessTracker:
         tk.Button(input_frame, text="Save Settings", command=self.save_settings,
                  bg="#4CAF50", fg="white").grid(row=2, column=0, columnspan=2, pady=10)
     
+    def get_record_date(self, entry: tk.Entry) -> Optional[str]:
+        """Date typed into an entry as YYYY-MM-DD, or None after showing an error"""
+        day = parse_day(entry.get())
+        if day is None:
+            messagebox.showerror("Error", "Please enter date as YYYY-MM-DD")
+            return None
+        return date.fromordinal(day).isoformat()
+    
     def add_income(self):
         """Add income record"""
+        record_date = self.get_record_date(self.income_date)
+        if record_date is None:
+            return
+        
         try:
             record = {
-                "date": self.income_date.get(),
+                "date": record_date,
                 "source": self.income_source.get(),
-                "amount": float(self.income_amount.get()),
+                "amount": self.get_currency().parse(self.income_amount.get()),
                 "description": self.income_desc.get()
             }
             self.data["income"].append(record)
-            self.refresh_income_display()
+            self.record_added("income", record)
+            self.insert_row("income", len(self.data["income"]) - 1)
             self.clear_income_fields()
             messagebox.showinfo("Success", "Income added successfully!")
         except ValueError:
@@ -352,15 +1238,20 @@ class BusinessTracker:
     
     def add_expense(self):
         """Add expense record"""
+        record_date = self.get_record_date(self.expense_date)
+        if record_date is None:
+            return
+        
         try:
             record = {
-                "date": self.expense_date.get(),
+                "date": record_date,
                 "category": self.expense_category.get(),
-                "amount": float(self.expense_amount.get()),
+                "amount": self.get_currency().parse(self.expense_amount.get()),
                 "description": self.expense_desc.get()
             }
             self.data["expenses"].append(record)
-            self.refresh_expense_display()
+            self.record_added("expenses", record)
+            self.insert_row("expenses", len(self.data["expenses"]) - 1)
             self.clear_expense_fields()
             messagebox.showinfo("Success", "Expense added successfully!")
         except ValueError:
@@ -368,13 +1259,18 @@ class BusinessTracker:
     
     def add_sale(self):
         """Add sales record"""
+        record_date = self.get_record_date(self.sale_date)
+        if record_date is None:
+            return
+        
         try:
+            money = self.get_currency()
             quantity = float(self.sale_quantity.get())
-            unit_price = float(self.sale_price.get())
-            total = quantity * unit_price
+            unit_price = money.parse(self.sale_price.get())
+            total = money.multiply(unit_price, quantity)
             
             record = {
-                "date": self.sale_date.get(),
+                "date": record_date,
                 "product": self.sale_product.get(),
                 "quantity": quantity,
                 "unit_price": unit_price,
@@ -382,7 +1278,8 @@ class BusinessTracker:
                 "customer": self.sale_customer.get()
             }
             self.data["sales"].append(record)
-            self.refresh_sales_display()
+            self.record_added("sales", record)
+            self.insert_row("sales", len(self.data["sales"]) - 1)
             self.clear_sales_fields()
             messagebox.showinfo("Success", "Sale added successfully!")
         except ValueError:
@@ -391,9 +1288,10 @@ class BusinessTracker:
     def add_stock(self):
         """Add or update stock record"""
         try:
+            money = self.get_currency()
             product = self.stock_product.get()
             quantity = float(self.stock_quantity.get())
-            cost = float(self.stock_cost.get())
+            cost = money.parse(self.stock_cost.get())
             supplier = self.stock_supplier.get()
             
             # Check if product already exists
@@ -407,32 +1305,28 @@ class BusinessTracker:
                 "product": product,
                 "quantity": quantity,
                 "unit_cost": cost,
-                "total_value": quantity * cost,
+                "total_value": money.multiply(cost, quantity),
                 "supplier": supplier
             }
             
             if existing_index is not None:
                 self.data["stock"][existing_index] = record
+                self.records_changed("stock")
+                self.refresh_stock_display()
                 messagebox.showinfo("Success", "Stock updated successfully!")
             else:
                 self.data["stock"].append(record)
+                self.record_added("stock", record)
+                self.insert_row("stock", len(self.data["stock"]) - 1)
                 messagebox.showinfo("Success", "Stock added successfully!")
             
-            self.refresh_stock_display()
             self.clear_stock_fields()
         except ValueError:
             messagebox.showerror("Error", "Please enter valid quantity and cost")
     
     def delete_record(self, record_type):
         """Delete selected record"""
-        trees = {
-            "income": self.income_tree,
-            "expenses": self.expense_tree,
-            "sales": self.sales_tree,
-            "stock": self.stock_tree
-        }
-        
-        tree = trees.get(record_type)
+        tree = self.trees().get(record_type)
         if not tree:
             return
         
@@ -442,13 +1336,122 @@ class BusinessTracker:
             return
         
         if messagebox.askyesno("Confirm", "Are you sure you want to delete this record?"):
-            for item in selected:
-                index = tree.index(item)
-                del self.data[record_type][index]
+            # Row ids are record indices; delete from the end so earlier ones stay valid
+            for index in sorted((int(item) for item in selected), reverse=True):
+                self.record_removed(record_type, index, self.data[record_type].pop(index))
             
             self.refresh_displays()
             messagebox.showinfo("Success", "Record deleted successfully!")
     
+    def get_currency(self) -> Currency:
+        """Currency used to parse, store and display money"""
+        return Currency.from_settings(self.data["settings"])
+    
+    def record_added(self, record_type: str, record: Dict[str, Any]):
+        """Update cached aggregates after a record is appended"""
+        self.columns.append(record_type, record)
+        self.series.add(record_type, record)
+        self.sorts.append(record_type, record)
+        self.schedule_trend_redraw()
+        self.schedule_report_refresh()
+    
+    def record_removed(self, record_type: str, index: int, record: Dict[str, Any]):
+        """Update cached aggregates after the record at index is deleted"""
+        self.columns.remove(record_type, index)
+        self.series.add(record_type, record, sign=-1)
+        self.sorts.invalidate(record_type)
+        self.schedule_trend_redraw()
+        self.schedule_report_refresh()
+    
+    def records_changed(self, record_type: Optional[str] = None):
+        """Discard cached aggregates after records are edited in place"""
+        self.columns.invalidate(record_type)
+        self.series.rebuild(record_type)
+        self.sorts.invalidate(record_type)
+        self.schedule_trend_redraw()
+        self.schedule_report_refresh()
+    
+    def schedule_report_refresh(self):
+        """Regenerate the displayed report once the current batch of changes is done"""
+        if self.current_report is not None and not self.report_refresh_pending:
+            self.report_refresh_pending = True
+            self.root.after_idle(self.refresh_report)
+    
+    def refresh_report(self):
+        """Show the current report again so no page mixes old and new data"""
+        self.report_refresh_pending = False
+        if self.current_report is not None:
+            self.report_pager.show(self.current_report())
+    
+    def schedule_trend_redraw(self):
+        """Redraw the profit trend once the current batch of changes is done"""
+        if not self.trend_redraw_pending:
+            self.trend_redraw_pending = True
+            self.root.after_idle(self.draw_profit_trend)
+    
+    def sort_by(self, record_type: str, column: str):
+        """Sort a Treeview by a column, toggling direction on repeated clicks"""
+        current = self.sort_state.get(record_type)
+        descending = current is not None and current[0] == column and not current[1]
+        self.sort_state[record_type] = (column, descending)
+        
+        tree = self.trees()[record_type]
+        for col in COLUMN_FIELDS[record_type]:
+            arrow = (" \u25bc" if descending else " \u25b2") if col == column else ""
+            tree.heading(col, text=col + arrow)
+        
+        self.refresh_display(record_type)
+    
+    def display_order(self, record_type: str) -> Iterable[int]:
+        """Record indices in the order the Treeview should show them"""
+        state = self.sort_state.get(record_type)
+        if state is None:
+            return range(len(self.data[record_type]))
+        
+        column, descending = state
+        order = self.sorts.order(record_type, COLUMN_FIELDS[record_type][column])
+        return reversed(order) if descending else order
+    
+    def trees(self) -> Dict[str, ttk.Treeview]:
+        """Treeview for each record type"""
+        return {
+            "income": self.income_tree,
+            "expenses": self.expense_tree,
+            "sales": self.sales_tree,
+            "stock": self.stock_tree
+        }
+    
+    def refresh_display(self, record_type: str):
+        """Refresh the Treeview of one record type"""
+        {
+            "income": self.refresh_income_display,
+            "expenses": self.refresh_expense_display,
+            "sales": self.refresh_sales_display,
+            "stock": self.refresh_stock_display
+        }[record_type]()
+    
+    def row_values(self, record_type: str, record: Dict[str, Any], money: Currency) -> tuple:
+        """Treeview cell values for a record, with money formatted for display"""
+        money_fields = MONEY_FIELDS[record_type]
+        return tuple(money.format(record[field]) if field in money_fields else record[field]
+                     for field in COLUMN_FIELDS[record_type].values())
+    
+    def insert_row(self, record_type: str, index: int):
+        """Show a newly appended record without rebuilding its Treeview"""
+        state = self.sort_state.get(record_type)
+        if state is None:
+            position = tk.END
+        else:
+            column, descending = state
+            position = self.sorts.position(record_type, COLUMN_FIELDS[record_type][column], index)
+            if descending:
+                position = len(self.data[record_type]) - 1 - position
+        
+        tree = self.trees()[record_type]
+        record = self.data[record_type][index]
+        tree.insert("", position, iid=str(index), values=self.row_values(record_type, record, self.get_currency()))
+        tree.see(str(index))
+    
     def refresh_displays(self):
         """Refresh all displays"""
         self.refresh_income_display()
@@ -459,57 +1462,42 @@ class BusinessTracker:
     def refresh_income_display(self):
         """Refresh income treeview"""
         self.income_tree.delete(*self.income_tree.get_children())
-        currency = self.data["settings"]["currency"]
+        money = self.get_currency()
         
-        for record in self.data["income"]:
-            self.income_tree.insert("", tk.END, values=(
-                record["date"],
-                record["source"],
-                f"{currency}{record['amount']:.2f}",
-                record["description"]
-            ))
+        records = self.data["income"]
+        for index in self.display_order("income"):
+            record = records[index]
+            self.income_tree.insert("", tk.END, iid=str(index), values=self.row_values("income", record, money))
     
     def refresh_expense_display(self):
         """Refresh expense treeview"""
         self.expense_tree.delete(*self.expense_tree.get_children())
-        currency = self.data["settings"]["currency"]
+        money = self.get_currency()
         
-        for record in self.data["expenses"]:
-            self.expense_tree.insert("", tk.END, values=(
-                record["date"],
-                record["category"],
-                f"{currency}{record['amount']:.2f}",
-                record["description"]
-            ))
+        records = self.data["expenses"]
+        for index in self.display_order("expenses"):
+            record = records[index]
+            self.expense_tree.insert("", tk.END, iid=str(index), values=self.row_values("expenses", record, money))
     
     def refresh_sales_display(self):
         """Refresh sales treeview"""
         self.sales_tree.delete(*self.sales_tree.get_children())
-        currency = self.data["settings"]["currency"]
+        money = self.get_currency()
         
-        for record in self.data["sales"]:
-            self.sales_tree.insert("", tk.END, values=(
-                record["date"],
-                record["product"],
-                record["quantity"],
-                f"{currency}{record['unit_price']:.2f}",
-                f"{currency}{record['total']:.2f}",
-                record["customer"]
-            ))
+        records = self.data["sales"]
+        for index in self.display_order("sales"):
+            record = records[index]
+            self.sales_tree.insert("", tk.END, iid=str(index), values=self.row_values("sales", record, money))
     
     def refresh_stock_display(self):
         """Refresh stock treeview"""
         self.stock_tree.delete(*self.stock_tree.get_children())
-        currency = self.data["settings"]["currency"]
+        money = self.get_currency()
         
-        for record in self.data["stock"]:
-            self.stock_tree.insert("", tk.END, values=(
-                record["product"],
-                record["quantity"],
-                f"{currency}{record['unit_cost']:.2f}",
-                f"{currency}{record['total_value']:.2f}",
-                record["supplier"]
-            ))
+        records = self.data["stock"]
+        for index in self.display_order("stock"):
+            record = records[index]
+            self.stock_tree.insert("", tk.END, iid=str(index), values=self.row_values("stock", record, money))
     
     def clear_income_fields(self):
         """Clear income input fields"""
@@ -545,155 +1533,202 @@ class BusinessTracker:
     
     def save_settings(self):
         """Save application settings"""
+        symbol = self.currency_symbol.get()
+        try:
+            rescaled = rescale_money(self.data, currency_scale(symbol))
+        except ValueError as e:
+            messagebox.showerror("Error", f"Cannot switch currency to {symbol}: {str(e)}")
+            return
+        
         self.data["settings"]["business_name"] = self.business_name.get()
-        self.data["settings"]["currency"] = self.currency_symbol.get()
+        self.data["settings"]["currency"] = symbol
+        if rescaled:
+            self.records_changed()
+        else:
+            # Only the symbol changed; cached totals are still valid
+            self.schedule_trend_redraw()
+            self.schedule_report_refresh()
         self.refresh_displays()
         messagebox.showinfo("Success", "Settings saved successfully!")
     
+    def show_report(self, report):
+        """Display a report in the summary pager, keeping it for saving"""
+        self.current_report = report
+        self.report_pager.show(report())
+    
     def generate_monthly_report(self):
         """Generate monthly financial report"""
-        current_month = date.today().strftime("%Y-%m")
-        currency = self.data["settings"]["currency"]
-        
-        # Calculate monthly totals
-        monthly_income = sum(record["amount"] for record in self.data["income"] 
-                           if record["date"].startswith(current_month))
-        monthly_expenses = sum(record["amount"] for record in self.data["expenses"] 
-                             if record["date"].startswith(current_month))
-        monthly_sales = sum(record["total"] for record in self.data["sales"] 
-                          if record["date"].startswith(current_month))
-        monthly_profit = monthly_income - monthly_expenses
-        
-        report = f"""
-MONTHLY FINANCIAL REPORT - {current_month}
-{'='*50}
-
-INCOME:
-Total Monthly Income: {currency}{monthly_income:.2f}
-
-EXPENSES:
-Total Monthly Expenses: {currency}{monthly_expenses:.2f}
-
-SALES:
-Total Monthly Sales: {currency}{monthly_sales:.2f}
-
-PROFIT/LOSS:
-Net Profit: {currency}{monthly_profit:.2f}
-
-EXPENSE BREAKDOWN:
-"""
-        
-        # Expense breakdown by category
-        expense_categories = {}
-        for record in self.data["expenses"]:
-            if record["date"].startswith(current_month):
-                category = record["category"]
-                if category in expense_categories:
-                    expense_categories[category] += record["amount"]
-                else:
-                    expense_categories[category] = record["amount"]
-        
-        for category, amount in expense_categories.items():
-            report += f"  {category}: {currency}{amount:.2f}\n"
-        
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(tk.END, report)
+        self.show_report(ReportBuilder(self.data, self.columns, self.series).monthly_report)
     
     def generate_profit_analysis(self):
         """Generate profit analysis report"""
-        currency = self.data["settings"]["currency"]
-        
-        total_income = sum(record["amount"] for record in self.data["income"])
-        total_expenses = sum(record["amount"] for record in self.data["expenses"])
-        total_sales = sum(record["total"] for record in self.data["sales"])
-        net_profit = total_income - total_expenses
-        
-        # Calculate stock value
-        stock_value = sum(record["total_value"] for record in self.data["stock"])
-        
-        report = f"""
-PROFIT ANALYSIS REPORT
-{'='*50}
-
-OVERALL FINANCIAL POSITION:
-Total Income: {currency}{total_income:.2f}
-Total Expenses: {currency}{total_expenses:.2f}
-Total Sales Revenue: {currency}{total_sales:.2f}
-Net Profit: {currency}{net_profit:.2f}
-
-ASSET VALUATION:
-Current Stock Value: {currency}{stock_value:.2f}
-
-PERFORMANCE METRICS:
-Profit Margin: {((net_profit / total_income) * 100) if total_income > 0 else 0:.1f}%
-Expense Ratio: {((total_expenses / total_income) * 100) if total_income > 0 else 0:.1f}%
-
-TOP PERFORMING PRODUCTS:
-"""
-        
-        # Product performance analysis
-        product_sales = {}
-        for record in self.data["sales"]:
-            product = record["product"]
-            if product in product_sales:
-                product_sales[product] += record["total"]
-            else:
-                product_sales[product] = record["total"]
-        
-        # Sort by revenue
-        sorted_products = sorted(product_sales.items(), key=lambda x: x[1], reverse=True)
-        for product, revenue in sorted_products[:5]:  # Top 5 products
-            report += f"  {product}: {currency}{revenue:.2f}\n"
-        
-        if not sorted_products:
-            report += "  No sales data available\n"
-        
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(tk.END, report)
+        self.show_report(ReportBuilder(self.data, self.columns, self.series).profit_analysis)
     
     def generate_stock_report(self):
         """Generate stock valuation report"""
-        currency = self.data["settings"]["currency"]
-        
-        total_stock_value = sum(record["total_value"] for record in self.data["stock"])
-        total_items = len(self.data["stock"])
+        self.show_report(ReportBuilder(self.data, self.columns, self.series).stock_report)
+    
+    def generate_range_report(self):
+        """Generate a summary for the dates entered on the Reports tab"""
+        first_day = parse_day(self.range_from.get())
+        last_day = parse_day(self.range_to.get())
+        if first_day is None or last_day is None:
+            messagebox.showerror("Error", "Please enter dates as YYYY-MM-DD")
+            return
+        if first_day > last_day:
+            messagebox.showerror("Error", "The From date must not be after the To date")
+            return
         
-        report = f"""
-STOCK VALUATION REPORT
-{'='*50}
-
-STOCK SUMMARY:
-Total Stock Items: {total_items}
-Total Stock Value: {currency}{total_stock_value:.2f}
-Average Item Value: {currency}{(total_stock_value / total_items) if total_items > 0 else 0:.2f}
-
-DETAILED STOCK BREAKDOWN:
-"""
+        first = date.fromordinal(first_day)
+        last = date.fromordinal(last_day)
+        builder = ReportBuilder(self.data, self.columns, self.series)
+        self.show_report(lambda: builder.range_report(first, last))
+    
+    def draw_profit_trend(self):
+        """Plot profit per day, week or month from the cumulative series"""
+        self.trend_redraw_pending = False
+        canvas = self.trend_canvas
+        canvas.delete("all")
+        
+        granularity = self.trend_granularity.get()
+        periods = trend_periods(granularity, date.today(), TREND_PERIOD_COUNTS[granularity])
+        profits = [self.series.profit(first, last) for _, first, last in periods]
+        
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        margin = 30
+        if width <= 2 * margin or height <= 2 * margin:
+            return
         
-        # Sort stock by value
-        sorted_stock = sorted(self.data["stock"], key=lambda x: x["total_value"], reverse=True)
+        money = self.get_currency()
+        peak = max(max(abs(profit) for profit in profits), 1)
+        zero_y = height / 2
+        scale = (height / 2 - margin) / peak
+        slot = (width - 2 * margin) / len(periods)
+        
+        canvas.create_line(margin, zero_y, width - margin, zero_y, fill="#9E9E9E")
+        canvas.create_text(margin, margin / 2, anchor=tk.W, text=f"Peak: {money.format(peak)}")
+        
+        label_every = max(1, len(periods) // 8)
+        for i, ((label, _, _), profit) in enumerate(zip(periods, profits)):
+            x0 = margin + i * slot + slot * 0.15
+            x1 = margin + (i + 1) * slot - slot * 0.15
+            y = zero_y - profit * scale
+            canvas.create_rectangle(x0, min(y, zero_y), x1, max(y, zero_y), outline="",
+                                    fill="#4CAF50" if profit >= 0 else "#f44336")
+            if i % label_every == 0:
+                canvas.create_text((x0 + x1) / 2, height - margin / 2, text=label, font=("Arial", 8))
+    
+    def start_export(self, export_format: str):
+        """Queue an Excel or PDF export of the selected report in a worker process"""
+        if self.export_pool is None:
+            # Spawn fresh workers rather than forking the running Tk process
+            context = multiprocessing.get_context("spawn")
+            self.export_pool = ProcessPoolExecutor(mp_context=context)
+            self.export_manager = context.Manager()
+            self.export_queue = self.export_manager.Queue()
+        
+        export_dir = "exports"
+        if not os.path.exists(export_dir):
+            os.makedirs(export_dir)
+        
+        job_id = self.next_export_id
+        self.next_export_id += 1
+        report = self.export_report.get()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        slug = report.lower().replace(" ", "_")
+        path = f"{export_dir}/{slug}_{timestamp}_{job_id}{EXPORT_FORMATS[export_format]}"
+        
+        # Serialize now so later edits can't change what the worker sees
+        snapshot = json.dumps(self.data, default=str)
+        cancel = self.export_manager.Event()
+        future = self.export_pool.submit(run_export_job, job_id, report, export_format,
+                                         snapshot, path, self.export_queue, cancel)
+        
+        self.export_jobs[job_id] = {"future": future, "cancel": cancel}
+        self.export_tree.insert("", tk.END, iid=str(job_id), values=(job_id, report, export_format, "Queued"))
+        if len(self.export_jobs) == 1:
+            self.root.after(100, self.poll_exports)
+    
+    def poll_exports(self):
+        """Show worker progress and results without blocking the GUI"""
+        while True:
+            try:
+                job_id, done, total = self.export_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job_id in self.export_jobs and not self.export_jobs[job_id]["cancel"].is_set():
+                self.set_export_status(job_id, f"Running {done * 100 // total}%")
+        
+        for job_id, job in list(self.export_jobs.items()):
+            future: Future = job["future"]
+            if not future.done():
+                continue
+            
+            del self.export_jobs[job_id]
+            if future.cancelled():
+                self.set_export_status(job_id, "Cancelled")
+                continue
+            
+            error = future.exception()
+            if error is None:
+                self.set_export_status(job_id, f"Saved {future.result()}")
+            elif isinstance(error, ExportCancelled):
+                self.set_export_status(job_id, "Cancelled")
+            else:
+                self.set_export_status(job_id, f"Failed: {error}")
         
-        for record in sorted_stock:
-            report += f"""
-Product: {record['product']}
-  Quantity: {record['quantity']}
-  Unit Cost: {currency}{record['unit_cost']:.2f}
-  Total Value: {currency}{record['total_value']:.2f}
-  Supplier: {record['supplier']}
-"""
+        if self.export_jobs:
+            self.root.after(100, self.poll_exports)
+    
+    def set_export_status(self, job_id: int, status: str):
+        """Update the status column of an export job"""
+        self.export_tree.set(str(job_id), "Status", status)
+    
+    def cancel_exports(self):
+        """Cancel the selected export jobs, queued or running"""
+        selected = self.export_tree.selection()
+        if not selected:
+            messagebox.showwarning("Warning", "Please select an export to cancel")
+            return
         
-        if not sorted_stock:
-            report += "No stock records available\n"
+        for item in selected:
+            job = self.export_jobs.get(int(item))
+            if job is None:
+                continue
+            if not job["future"].cancel():
+                job["cancel"].set()
+                self.set_export_status(int(item), "Cancelling...")
+    
+    def on_close(self):
+        """Stop export workers before closing the window"""
+        if self.export_pool is not None:
+            for job in self.export_jobs.values():
+                job["future"].cancel()
+                job["cancel"].set()
+            self.export_pool.shutdown(wait=False, cancel_futures=True)
+            self.export_manager.shutdown()
+        self.root.destroy()
+    
+    def save_report(self):
+        """Write the current report to a text file and redisplay it from the same data"""
+        if self.current_report is None:
+            messagebox.showwarning("Warning", "Please generate a report first")
+            return
         
-        # Low stock alerts (items with quantity < 10)
-        low_stock = [item for item in self.data["stock"] if item["quantity"] < 10]
-        if low_stock:
-            report += f"\nLOW STOCK ALERTS:\n"
-            for item in low_stock:
-                report += f"  {item['product']}: {item['quantity']} units remaining\n"
+        filename = filedialog.asksaveasfilename(defaultextension=".txt",
+                                                filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not filename:
+            return
         
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(tk.END, report)
+        try:
+            with open(filename, 'w') as f:
+                f.writelines(line + "\n" for line in self.current_report())
+            # Regenerate the display so it matches the saved file after any edits
+            self.report_pager.show(self.current_report())
+            messagebox.showinfo("Success", f"Report saved to {filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save report: {str(e)}")
     
     def export_to_csv(self):
         """Export all data to CSV files"""
@@ -704,6 +1739,7 @@ Product: {record['product']}
                 os.makedirs(export_dir)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            money = self.get_currency()
             
             # Export income data
             if self.data["income"]:
@@ -712,7 +1748,7 @@ Product: {record['product']}
                     writer.writerow(["Date", "Source", "Amount", "Description"])
                     for record in self.data["income"]:
                         writer.writerow([record["date"], record["source"], 
-                                       record["amount"], record["description"]])
+                                       money.to_text(record["amount"]), record["description"]])
             
             # Export expenses data
             if self.data["expenses"]:
@@ -721,7 +1757,7 @@ Product: {record['product']}
                     writer.writerow(["Date", "Category", "Amount", "Description"])
                     for record in self.data["expenses"]:
                         writer.writerow([record["date"], record["category"], 
-                                       record["amount"], record["description"]])
+                                       money.to_text(record["amount"]), record["description"]])
             
             # Export sales data
             if self.data["sales"]:
@@ -730,7 +1766,8 @@ Product: {record['product']}
                     writer.writerow(["Date", "Product", "Quantity", "Unit Price", "Total", "Customer"])
                     for record in self.data["sales"]:
                         writer.writerow([record["date"], record["product"], record["quantity"],
-                                       record["unit_price"], record["total"], record["customer"]])
+                                       money.to_text(record["unit_price"]), money.to_text(record["total"]),
+                                       record["customer"]])
             
             # Export stock data
             if self.data["stock"]:
@@ -738,8 +1775,8 @@ Product: {record['product']}
                     writer = csv.writer(f)
                     writer.writerow(["Product", "Quantity", "Unit Cost", "Total Value", "Supplier"])
                     for record in self.data["stock"]:
-                        writer.writerow([record["product"], record["quantity"], record["unit_cost"],
-                                       record["total_value"], record["supplier"]])
+                        writer.writerow([record["product"], record["quantity"], money.to_text(record["unit_cost"]),
+                                       money.to_text(record["total_value"]), record["supplier"]])
             
             messagebox.showinfo("Success", f"Data exported successfully to {export_dir}/ folder!")
             